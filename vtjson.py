@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import datetime
+import fnmatch
+import functools
 import ipaddress
+import itertools
 import math
+import operator
 import pathlib
 import re
 import sys
+import threading
 import types
 import typing
 import urllib.parse
@@ -13,10 +18,12 @@ import warnings
 from collections.abc import Sequence, Set, Sized
 from dataclasses import dataclass
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Container,
     Generic,
+    Iterable,
     Mapping,
     Type,
     TypeVar,
@@ -82,9 +89,10 @@ else:
         Protocol,
     )
 
-import dns.resolver
-import email_validator
-import idna
+# dnspython, email_validator and idna are slow to import. So they are only
+# imported by the schemas that use them.
+if TYPE_CHECKING:
+    import dns.resolver
 
 
 def safe_cast(schema: Type[T], obj: Any) -> T:
@@ -246,6 +254,8 @@ class Apply:
 skip_first = Apply(skip_first=True)
 
 _dns_resolver: dns.resolver.Resolver | None = None
+_dns_resolver_lock = threading.Lock()
+_email_validator: types.ModuleType | None = None
 
 
 def _generic_name(origin: type, args: tuple[object, ...]) -> str:
@@ -291,32 +301,183 @@ def _to_dict(
 
 
 def _get_dns_resolver() -> dns.resolver.Resolver:
+    # The resolver is shared by email(check_deliverability=True) and
+    # domain_name(resolve=True). Its cache stores both positive and negative
+    # (NXDOMAIN, no answer) responses and honours their TTL. So repeated
+    # validation of the same domain does not go to the network again.
+    # The lock makes sure that concurrent first calls do not create
+    # different resolvers with separate caches.
     global _dns_resolver
     if _dns_resolver is not None:
         return _dns_resolver
-    _dns_resolver = dns.resolver.Resolver()
-    _dns_resolver.cache = dns.resolver.LRUCache()
-    _dns_resolver.timeout = 10
-    _dns_resolver.lifetime = 10
+    with _dns_resolver_lock:
+        if _dns_resolver is None:
+            import dns.resolver
+
+            resolver = dns.resolver.Resolver()
+            resolver.cache = dns.resolver.LRUCache()
+            resolver.timeout = 10
+            resolver.lifetime = 10
+            _dns_resolver = resolver
     return _dns_resolver
 
 
+def _get_email_validator() -> types.ModuleType:
+    # Importing is idempotent, so no lock is needed here. Keeping the module
+    # avoids an import lookup on every validation.
+    global _email_validator
+    if _email_validator is None:
+        import email_validator
+
+        _email_validator = email_validator
+    return _email_validator
+
+
+@functools.lru_cache(maxsize=1024)
+def _re_compile(pattern: str, flags: int) -> re.Pattern[str]:
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=4096)
+def _idna_check(domain: str) -> str:
+    # The idna encoding dominates the cost of domain_name and the same domains
+    # tend to be validated over and over. Returns "" or the idna error.
+    import idna
+
+    try:
+        idna.encode(domain, uts46=False)
+    except idna.core.IDNAError as e:
+        return str(e)
+    return ""
+
+
+# Regular expressions without special characters (other than a leading "^")
+# are matched with plain string operations.
+_literal_regex = re.compile(r"\^?([\w/:@,;=-]+)")
+
+# Dotted decimal IPv4 addresses without leading zeros. These are accepted by
+# the ipaddress module in all Python versions.
+_ipv4_octet = r"(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+_ipv4_regex = re.compile(rf"(?:{_ipv4_octet}\.){{3}}{_ipv4_octet}")
+
+
+# The regular expressions used by `strptime` for its numerical directives,
+# restricted to ascii digits and without the space padded variants.
+_strptime_directives = {
+    "Y": r"(\d\d\d\d)",
+    "y": r"(\d\d)",
+    "m": r"(1[0-2]|0[1-9]|[1-9])",
+    "d": r"(3[0-1]|[1-2]\d|0[1-9]|[1-9])",
+    "H": r"(2[0-3]|[0-1]\d|\d)",
+    "M": r"([0-5]\d|\d)",
+    "S": r"([0-5]\d|\d)",
+    "f": r"([0-9]{1,6})",
+}
+
+
+def _strptime_pattern(format: str) -> tuple[re.Pattern[str], tuple[str, ...]] | None:
+    """
+    Translates a format string for `strptime` into a regular expression and
+    the list of directives corresponding to its groups. Returns `None` if the
+    format string uses directives other than the numerical ones in
+    `_strptime_directives`, or uses one of them twice.
+    """
+    pattern = ""
+    directives: list[str] = []
+    i = 0
+    while i < len(format):
+        c = format[i]
+        i += 1
+        if c != "%":
+            pattern += re.escape(c)
+            continue
+        d = format[i] if i < len(format) else ""
+        i += 1
+        if d == "%":
+            pattern += "%"
+        elif d in _strptime_directives and d not in directives:
+            pattern += _strptime_directives[d]
+            directives.append(d)
+        else:
+            return None
+    if "Y" in directives and "y" in directives:
+        return None
+    return _re_compile(pattern, re.ASCII), tuple(directives)
+
+
+def _strptime_parse(
+    obj: str, pattern: re.Pattern[str], directives: tuple[str, ...]
+) -> bool:
+    """
+    Returns `True` if `obj` can be parsed using the output of
+    `_strptime_pattern`. A return value of `False` is inconclusive.
+    """
+    m = pattern.match(obj)
+    if m is None or m.end() != len(obj):
+        return False
+    v = dict(zip(directives, m.groups()))
+    if "Y" in v:
+        year = int(v["Y"])
+    elif "y" in v:
+        year = int(v["y"])
+        year += 2000 if year <= 68 else 1900
+    else:
+        year = 1900
+    try:
+        datetime.datetime(
+            year,
+            int(v.get("m", 1)),
+            int(v.get("d", 1)),
+            int(v.get("H", 0)),
+            int(v.get("M", 0)),
+            int(v.get("S", 0)),
+            int(v.get("f", "0").ljust(6, "0")),
+        )
+    except ValueError:
+        return False
+    return True
+
+
+# The string representation of a list, tuple or dict starts with that of its
+# first 40 entries, minus the closing bracket, unless the container is
+# reachable from these entries (the recursion markers would differ). So we
+# only use this if the entries are atoms. If the head then has at least 120
+# characters, the full representation is truncated to the same first 99
+# characters, and only these entries need to be converted.
+_c_containers: dict[type, str] = {list: "]", tuple: ")", dict: "}"}
+_c_atoms = frozenset({int, float, bool, str, bytes, type(None)})
+
+
 def _c(s: object) -> str:
+    tail = _c_containers.get(type(s))
+    if tail is not None and len(cast(Sized, s)) >= 40:
+        head = ""
+        if isinstance(s, dict):
+            items = tuple(itertools.islice(s.items(), 40))
+            if all(type(k) in _c_atoms and type(v) in _c_atoms for k, v in items):
+                head = str(dict(items))
+        else:
+            entries = cast(Sequence[object], s)[:40]
+            if all(type(e) in _c_atoms for e in entries):
+                head = str(entries)
+        if len(head) >= 120:
+            return f"{head[:99]}...[TRUNCATED]...{tail}"
+    if type(s) is bytes and len(s) >= 120:
+        # Likewise the representation of long bytes starts with that of their
+        # first 120 bytes, provided both use the same quotes.
+        head_ = s[:120]
+        if (b"'" in s and b'"' not in s) == (b"'" in head_ and b'"' not in head_):
+            return f"{str(head_)[:99]}...[TRUNCATED]..."
     ss = str(s)
-    if len(ss) > 0:
-        c = ss[-1]
-    else:
-        c = ""
-    if len(ss) < 120:
-        ret = ss
-    else:
-        ret = f"{ss[:99]}...[TRUNCATED]..."
-        if not isinstance(s, str) and c in r"])}":
-            ret += c
     if isinstance(s, str):
-        return repr(ret)
-    else:
-        return ret
+        if len(ss) < 120:
+            return repr(ss)
+        return repr(f"{ss[:99]}...[TRUNCATED]...")
+    if len(ss) < 120:
+        return ss
+    # For truncated containers we keep the closing bracket.
+    tail = ss[-1] if ss[-1] in "])}" else ""
+    return f"{ss[:99]}...[TRUNCATED]...{tail}"
 
 
 T = TypeVar("T")
@@ -360,14 +521,19 @@ def _wrong_type_message(
 
 class _validate_meta(type):
     __schema__: object
+    __check__: Callable[[object, str, bool, Mapping[str, object]], str] | None
     __strict__: bool
     __subs__: Mapping[str, object]
     __dbg__: bool
 
     def __instancecheck__(cls, obj: object) -> bool:
-        valid = _validate(
-            cls.__schema__, obj, "object", strict=cls.__strict__, subs=cls.__subs__
-        )
+        check = cls.__check__
+        if check is None:
+            # The schema is compiled on first use, so that it may contain
+            # forward references which are resolved after make_type.
+            check = compile(cls.__schema__).__validate__
+            cls.__check__ = check
+        valid = check(obj, "object", cls.__strict__, cls.__subs__)
         if cls.__dbg__ and valid != "":
             print(f"DEBUG: {valid}")
         return valid == ""
@@ -404,6 +570,7 @@ def make_type(
         (),
         {
             "__schema__": schema,
+            "__check__": None,
             "__strict__": strict,
             "__dbg__": debug,
             "__subs__": subs,
@@ -450,15 +617,58 @@ StringKeyType = TypeVar("StringKeyType", bound=Union[str, optional_key[str]])
 
 class _union(compiled_schema):
     schemas: list[compiled_schema]
+    consts: dict[type, frozenset[object]]
+    types: tuple[type, ...]
+    validators: tuple[Callable[[object, str, bool, Mapping[str, object]], str], ...]
 
     def __init__(
         self,
         schemas: tuple[object, ...],
         _deferred_compiles: _mapping | None = None,
     ) -> None:
-        self.schemas = [
-            _compile(s, _deferred_compiles=_deferred_compiles) for s in schemas
-        ]
+        self.schemas = []
+        # Nested unions are flattened. This gives the same result and the same
+        # message, and the fast paths below then cover all the alternatives.
+        for s in schemas:
+            c = _compile(s, _deferred_compiles=_deferred_compiles)
+            if isinstance(c, _union):
+                self.schemas.extend(c.schemas)
+            else:
+                self.schemas.append(c)
+        # Hashable const schemas, indexed by their type, so that the common
+        # case of an object equal to one of them is handled by a single
+        # lookup. Likewise an object that is an instance of one of the type
+        # schemas is accepted by a single isinstance check. Only the leading
+        # const and type schemas are used. A later alternative that accepts
+        # would otherwise skip the earlier ones, which may raise (e.g.
+        # set_label) or print (debug=True). For the same reason, and to avoid
+        # running a failing check twice, only classes whose metaclass is type
+        # are used (so not those made by make_type). Floats are compared using
+        # math.isclose so they are skipped. Constants that are not equal to
+        # themselves (e.g. Decimal("NaN")) are skipped as well, since a set
+        # lookup would accept them by identity.
+        consts: dict[type, set[object]] = {}
+        types: list[type] = []
+        for schema in self.schemas:
+            if type(schema) is _const:
+                if isinstance(schema.schema, float):
+                    continue
+                try:
+                    hash(schema.schema)
+                    if not schema.schema == schema.schema:
+                        continue
+                except Exception:
+                    continue
+                consts.setdefault(type(schema.schema), set()).add(schema.schema)
+            elif type(schema) is _type and type(schema.schema) is type:
+                types.append(schema.schema)
+                if schema.schema == float:
+                    types.append(int)
+            else:
+                break
+        self.consts = {k: frozenset(v) for k, v in consts.items()}
+        self.types = tuple(types)
+        self.validators = tuple(schema.__validate__ for schema in self.schemas)
 
     def __validate__(
         self,
@@ -467,9 +677,14 @@ class _union(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        try:
+            if obj in self.consts.get(type(obj), ()) or isinstance(obj, self.types):
+                return ""
+        except Exception:
+            pass
         messages = []
-        for schema in self.schemas:
-            message = schema.__validate__(obj, name=name, strict=strict, subs=subs)
+        for validate in self.validators:
+            message = validate(obj, name, strict, subs)
             if message == "":
                 return ""
             else:
@@ -496,16 +711,23 @@ class union(wrapper):
 
 
 class _intersect(compiled_schema):
-    schema: list[compiled_schema]
+    schemas: list[compiled_schema]
+    validators: tuple[Callable[[object, str, bool, Mapping[str, object]], str], ...]
 
     def __init__(
         self,
         schemas: tuple[object, ...],
         _deferred_compiles: _mapping | None = None,
     ) -> None:
-        self.schemas = [
-            _compile(s, _deferred_compiles=_deferred_compiles) for s in schemas
-        ]
+        self.schemas = []
+        # Nested intersections are flattened, like nested unions.
+        for s in schemas:
+            c = _compile(s, _deferred_compiles=_deferred_compiles)
+            if isinstance(c, _intersect):
+                self.schemas.extend(c.schemas)
+            else:
+                self.schemas.append(c)
+        self.validators = tuple(schema.__validate__ for schema in self.schemas)
 
     def __validate__(
         self,
@@ -514,8 +736,8 @@ class _intersect(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        for schema in self.schemas:
-            message = schema.__validate__(obj, name=name, strict=strict, subs=subs)
+        for validate in self.validators:
+            message = validate(obj, name, strict, subs)
             if message != "":
                 return message
         return ""
@@ -586,6 +808,9 @@ class _lax(compiled_schema):
         self, schema: object, _deferred_compiles: _mapping | None = None
     ) -> None:
         self.schema = _compile(schema, _deferred_compiles=_deferred_compiles)
+        # An inner lax/strict overrides the flag anyway.
+        if isinstance(self.schema, (_lax, _strict)):
+            setattr(self, "__validate__", self.schema.__validate__)
 
     def __validate__(
         self,
@@ -623,6 +848,9 @@ class _strict(compiled_schema):
         self, schema: object, _deferred_compiles: _mapping | None = None
     ) -> None:
         self.schema = _compile(schema, _deferred_compiles=_deferred_compiles)
+        # An inner lax/strict overrides the flag anyway.
+        if isinstance(self.schema, (_lax, _strict)):
+            setattr(self, "__validate__", self.schema.__validate__)
 
     def __validate__(
         self,
@@ -654,6 +882,7 @@ class strict(wrapper):
 class _set_label(compiled_schema):
     schema: compiled_schema
     labels: set[str]
+    label: str
     debug: bool
 
     def __init__(
@@ -666,6 +895,9 @@ class _set_label(compiled_schema):
         self.schema = _compile(schema, _deferred_compiles=_deferred_compiles)
         self.labels = labels
         self.debug = debug
+        if len(labels) == 1:
+            (self.label,) = labels
+            setattr(self, "__validate__", self.__validate_label__)
 
     def __validate__(
         self,
@@ -674,6 +906,10 @@ class _set_label(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        # Usually there are no substitutions for our labels, which is checked
+        # without allocating anything.
+        if not subs or self.labels.isdisjoint(subs):
+            return self.schema.__validate__(obj, name, True, subs)
         common_labels = tuple(set(subs.keys()).intersection(self.labels))
         if len(common_labels) >= 2:
             raise ValidationError(
@@ -692,6 +928,21 @@ class _set_label(compiled_schema):
         else:
             return self.schema.__validate__(obj, name=name, strict=True, subs=subs)
 
+    def __validate_label__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        # Specialization of __validate__ for a single label, which needs only a
+        # single lookup in subs.
+        if self.label in subs:
+            if self.debug:
+                print(f"The schema for {name} (key:{self.label}) was replaced")
+            return _validate(subs[self.label], obj, name=name, strict=True, subs=subs)
+        return self.schema.__validate__(obj, name=name, strict=True, subs=subs)
+
 
 class set_label(wrapper):
     """
@@ -832,6 +1083,8 @@ class regex(compiled_schema):
     fullmatch: bool
     __name__: str
     pattern: re.Pattern[str]
+    matcher: Callable[[str], re.Match[str] | None]
+    literal: str | None
 
     def __init__(
         self,
@@ -863,13 +1116,24 @@ class regex(compiled_schema):
             self.__name__ = f"regex({repr(regex)}{_fullmatch}{_flags})"
 
         try:
-            self.pattern = re.compile(regex, flags)
+            self.pattern = _re_compile(regex, flags)
         except Exception as e:
             _name = f" (name: {repr(name)})" if name is not None else ""
             raise SchemaError(
                 f"{regex}{_name} is an invalid regular expression: {str(e)}"
             ) from None
 
+        if fullmatch:
+            self.matcher = self.pattern.fullmatch
+        else:
+            self.matcher = self.pattern.match
+
+        self.literal = None
+        if flags == 0 and isinstance(regex, str):
+            m = _literal_regex.fullmatch(regex)
+            if m is not None:
+                self.literal = m.group(1)
+
     def __validate__(
         self,
         obj: object,
@@ -879,16 +1143,80 @@ class regex(compiled_schema):
     ) -> str:
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, self.__name__)
-        try:
-            if self.fullmatch and self.pattern.fullmatch(obj):
+        # A literal pattern is matched with plain string operations. This is
+        # done here rather than in a specialized method so that subclasses
+        # overriding __validate__ keep working.
+        if self.literal is not None:
+            if self.fullmatch:
+                if obj == self.literal:
+                    return ""
+            elif obj.startswith(self.literal):
                 return ""
-            elif not self.fullmatch and self.pattern.match(obj):
+            return _wrong_type_message(obj, name, self.__name__)
+        try:
+            if self.matcher(obj):
                 return ""
         except Exception:
             pass
         return _wrong_type_message(obj, name, self.__name__)
 
 
+class charset(compiled_schema):
+    """
+    Matches the strings all of whose characters belong to a given collection
+    of characters. The check is done by `str.translate`, so this is much
+    faster than inspecting the characters one by one in Python.
+    """
+
+    chars: str
+    table: dict[int, int | None]
+    __name__: str
+
+    def __init__(self, chars: str, name: str | None = None) -> None:
+        """
+        :param chars: the allowed characters
+        :param name: common name for the collection of characters that will be
+          used in non-validation messages
+
+        :raises SchemaError: exception thrown when the schema definition is
+          found to contain an error
+        """
+        if not isinstance(chars, str):
+            raise SchemaError(f"The characters {_c(chars)} are not a string")
+        if name is not None and not isinstance(name, str):
+            raise SchemaError(f"The charset name {_c(name)} is not a string")
+        self.chars = chars
+        self.table = str.maketrans("", "", chars)
+        if name is None:
+            self.__name__ = f"charset({repr(chars)})"
+        else:
+            self.__name__ = name
+
+    def __validate__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        if not isinstance(obj, str):
+            return _wrong_type_message(obj, name, self.__name__)
+        remainder = obj.translate(self.table)
+        if remainder != "":
+            return _wrong_type_message(
+                obj,
+                name,
+                self.__name__,
+                f"{repr(remainder[0])} is not an allowed character",
+            )
+        return ""
+
+
+# On posix systems, `pathlib.PurePath().match()` compares the last path
+# components one by one using `fnmatch.fnmatchcase()`.
+_posix_paths = isinstance(pathlib.PurePath(), pathlib.PurePosixPath)
+
+
 class glob(compiled_schema):
     """
     Unix style filename matching. This is implemented using
@@ -896,6 +1224,7 @@ class glob(compiled_schema):
     """
 
     pattern: str
+    component_pattern: re.Pattern[str] | None
     __name__: str
 
     def __init__(self, pattern: str, name: str | None = None) -> None:
@@ -923,6 +1252,13 @@ class glob(compiled_schema):
                 f"{repr(pattern)}{_name} is not a valid filename pattern: {str(e)}"
             ) from None
 
+        # A pattern consisting of a single component is matched directly
+        # against objects consisting of a single component, avoiding the
+        # construction of a PurePath.
+        self.component_pattern = None
+        if _posix_paths and "/" not in pattern:
+            self.component_pattern = _re_compile(fnmatch.translate(pattern), 0)
+
     def __validate__(
         self,
         obj: object,
@@ -932,6 +1268,14 @@ class glob(compiled_schema):
     ) -> str:
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, self.__name__)
+        if (
+            self.component_pattern is not None
+            and "/" not in obj
+            and obj not in ("", ".")
+        ):
+            if self.component_pattern.match(obj):
+                return ""
+            return _wrong_type_message(obj, name, self.__name__)
         try:
             if pathlib.PurePath(obj).match(self.pattern):
                 return ""
@@ -1055,6 +1399,8 @@ class close_to(compiled_schema):
     """
 
     kw: dict[str, float]
+    rel_tol: int | float
+    abs_tol: int | float
     x: int | float
     __name__: str
 
@@ -1091,6 +1437,10 @@ class close_to(compiled_schema):
         kwl_ = ",".join(kwl)
         self.__name__ = f"close_to({kwl_})"
         self.x = x
+        # Passing the tolerances explicitly (with the defaults of
+        # math.isclose) is much faster than unpacking self.kw on every call.
+        self.rel_tol = self.kw.get("rel_tol", 1e-09)
+        self.abs_tol = self.kw.get("abs_tol", 0.0)
 
     def __validate__(
         self,
@@ -1101,7 +1451,7 @@ class close_to(compiled_schema):
     ) -> str:
         if not isinstance(obj, (float, int)):
             return _wrong_type_message(obj, name, "number")
-        elif math.isclose(obj, self.x, **self.kw):
+        elif math.isclose(obj, self.x, rel_tol=self.rel_tol, abs_tol=self.abs_tol):
             return ""
         else:
             return _wrong_type_message(obj, name, self.__name__)
@@ -1278,6 +1628,11 @@ class interval(compiled_schema):
 
     lb_s: str
     ub_s: str
+    lb: comparable
+    ub: comparable
+    lower_cmp: Callable[[Any, Any], Any]
+    upper_cmp: Callable[[Any, Any], Any]
+    bounds: _intersect
 
     def __init__(
         self,
@@ -1323,7 +1678,12 @@ class interval(compiled_schema):
                     f"The upper and lower bound in the interval"
                     f" {ld}{self.lb_s},{self.ub_s}{ud} are incomparable"
                 ) from None
-            setattr(self, "__validate__", _intersect((lower, upper)).__validate__)
+            self.lb = lb
+            self.ub = ub
+            self.lower_cmp = operator.lt if strict_lb else operator.le
+            self.upper_cmp = operator.gt if strict_ub else operator.ge
+            self.bounds = _intersect((lower, upper))
+            setattr(self, "__validate__", self.__validate_bounds__)
         elif ub is not ...:
             try:
                 ub <= ub
@@ -1345,6 +1705,20 @@ class interval(compiled_schema):
         else:
             setattr(self, "__validate__", anything().__validate__)
 
+    def __validate_bounds__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        try:
+            if self.lower_cmp(self.lb, obj) and self.upper_cmp(self.ub, obj):
+                return ""
+        except Exception:
+            pass
+        return self.bounds.__validate__(obj, name=name, strict=strict, subs=subs)
+
 
 class size(compiled_schema):
     """
@@ -1353,6 +1727,8 @@ class size(compiled_schema):
     """
 
     interval_: interval
+    lb: int
+    ub: int | float
 
     def __init__(self, lb: int, ub: int | types.EllipsisType | None = None) -> None:
         """
@@ -1383,6 +1759,8 @@ class size(compiled_schema):
                 f"than the upper bound (value: {repr(ub)})"
             )
         self.interval_ = interval(lb, ub)
+        self.lb = lb
+        self.ub = ub if isinstance(ub, int) else math.inf
 
     def __validate__(
         self,
@@ -1395,6 +1773,8 @@ class size(compiled_schema):
             return f"{name} (value:{_c(obj)}) has no len()"
 
         L = len(obj)
+        if self.lb <= L <= self.ub:
+            return ""
 
         return self.interval_.__validate__(L, f"len({name})", strict, subs)
 
@@ -1402,10 +1782,19 @@ class size(compiled_schema):
 class _deferred(compiled_schema):
     collection: _mapping
     key: object
+    validator: Callable[[object, str, bool, Mapping[str, object]], str] | None
 
     def __init__(self, collection: _mapping, key: object) -> None:
         self.collection = collection
         self.key = key
+        self.validator = None
+
+    def resolve(self, schema: compiled_schema) -> None:
+        # Called by _compile once the schema for key has been compiled. The
+        # schemas holding a reference to us then validate without looking it
+        # up in the collection.
+        self.validator = schema.__validate__
+        setattr(self, "__validate__", self.validator)
 
     def __validate__(
         self,
@@ -1414,6 +1803,8 @@ class _deferred(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.validator is not None:
+            return self.validator(obj, name, strict, subs)
         if self.key not in self.collection:
             raise ValidationError(f"{name}: key {self.key} is unknown")
         return self.collection[self.key].__validate__(
@@ -1421,17 +1812,25 @@ class _deferred(compiled_schema):
         )
 
 
+@dataclass
+class _mapping_entry:
+    key: object
+    value: compiled_schema
+    in_use: bool = False
+
+
 class _mapping:
-    mapping: dict[int, tuple[object, compiled_schema, bool]]
+    mapping: dict[int, _mapping_entry]
 
     def __init__(self) -> None:
         self.mapping = {}
 
     def __setitem__(self, key: object, value: compiled_schema) -> None:
-        self.mapping[id(key)] = (key, value, False)
+        # The entry keeps a reference to the key so that its id stays valid.
+        self.mapping[id(key)] = _mapping_entry(key, value)
 
     def __getitem__(self, key: object) -> compiled_schema:
-        return self.mapping[id(key)][1]
+        return self.mapping[id(key)].value
 
     def __delitem__(self, key: object) -> None:
         del self.mapping[id(key)]
@@ -1440,11 +1839,10 @@ class _mapping:
         return id(key) in self.mapping
 
     def in_use(self, key: object) -> bool:
-        return self.mapping[id(key)][2]
+        return self.mapping[id(key)].in_use
 
     def set_in_use(self, key: object, value: bool) -> None:
-        m = self.mapping[id(key)]
-        self.mapping[id(key)] = (m[0], m[1], value)
+        self.mapping[id(key)].in_use = value
 
 
 class _validate_schema(compiled_schema):
@@ -1502,12 +1900,18 @@ def _compile(
     if isinstance(schema, compiled_schema):
         ret = schema
     elif isinstance(schema, type) and issubclass(schema, compiled_schema):
-        try:
-            ret = schema()
-        except Exception:
-            raise SchemaError(
-                f"{repr(schema.__name__)} does " f"not have a no-argument constructor"
-            ) from None
+        if schema in _internable_schemas:
+            if schema not in _interned_schemas:
+                _interned_schemas[schema] = schema()
+            ret = _interned_schemas[schema]
+        else:
+            try:
+                ret = schema()
+            except Exception:
+                raise SchemaError(
+                    f"{repr(schema.__name__)} does "
+                    f"not have a no-argument constructor"
+                ) from None
     elif hasattr(schema, "__validate__"):
         ret = _validate_schema(schema)
     elif isinstance(schema, wrapper):
@@ -1571,6 +1975,7 @@ def _compile(
 
     # back to updating the cache
     if _deferred_compiles.in_use(schema):
+        cast(_deferred, _deferred_compiles[schema]).resolve(ret)
         _deferred_compiles[schema] = ret
     else:
         del _deferred_compiles[schema]
@@ -1622,6 +2027,34 @@ def validate(
         raise ValidationError(message)
 
 
+def validate_many(
+    schema: object,
+    objs: Iterable[object],
+    name: str = "object",
+    strict: bool = True,
+    subs: Mapping[str, object] = {},
+) -> list[str]:
+    """
+    Validates the given objects against the given schema. The schema is
+    compiled only once.
+
+    :param schema: the given schema
+    :param objs: the objects to be validated
+    :param name: common name for the objects to be validated; used in
+      non-validation messages
+    :param strict: indicates whether or not the objects being validated are
+      allowed to have keys/entries which are not in the schema
+    :param subs: a dictionary whose keys are labels and whose values are
+      substitution schemas for schemas with those labels
+    :return: a list with, for each object, an explanation about what went
+      wrong, or the empty string if the object validates
+    :raises SchemaError: exception thrown when the schema definition is found
+      to contain an error
+    """
+    validator = compile(schema).__validate__
+    return [validator(obj, name, strict, subs) for obj in objs]
+
+
 # Some predefined schemas
 
 
@@ -1682,10 +2115,11 @@ class email(compiled_schema):
           `email_validator.validate_email`
         """
         self.kw = kw
-        if "dns_resolver" not in kw:
-            self.kw["dns_resolver"] = _get_dns_resolver()
         if "check_deliverability" not in kw:
             self.kw["check_deliverability"] = False
+        # The resolver is only needed for deliverability checks.
+        if "dns_resolver" not in kw and kw["check_deliverability"] is not False:
+            self.kw["dns_resolver"] = _get_dns_resolver()
 
     def __validate__(
         self,
@@ -1696,6 +2130,7 @@ class email(compiled_schema):
     ) -> str:
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, "email", f"{_c(obj)} is not a string")
+        email_validator = _get_email_validator()
         try:
             email_validator.validate_email(obj, **self.kw)
             return ""
@@ -1729,6 +2164,9 @@ class ip_address(compiled_schema):
             self.method = ipaddress.IPv6Address
         else:
             self.method = ipaddress.ip_address
+        # Subclasses that override __validate__ are left alone.
+        if version != 6 and type(self).__validate__ is ip_address.__validate__:
+            setattr(self, "__validate__", self.__validate_ipv4__)
 
     def __validate__(
         self,
@@ -1745,6 +2183,20 @@ class ip_address(compiled_schema):
             return _wrong_type_message(obj, name, self.__name__, explanation=str(e))
         return ""
 
+    def __validate_ipv4__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        # The common case of an IPv4 address in dotted decimal notation is
+        # accepted by a single regex match, without constructing an address
+        # object. Everything else is left to the ipaddress module.
+        if isinstance(obj, str) and _ipv4_regex.fullmatch(obj):
+            return ""
+        return ip_address.__validate__(self, obj, name, strict, subs)
+
 
 class url(compiled_schema):
     """
@@ -1760,9 +2212,15 @@ class url(compiled_schema):
     ) -> str:
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, "url")
-        result = urllib.parse.urlparse(obj)
-        if all([result.scheme, result.netloc]):
-            return ""
+        # A url has a scheme and a netloc only if it contains "://", which is
+        # a much cheaper check than parsing it. But urlsplit first removes
+        # tabs and newlines, so strings with non-printable characters are
+        # always parsed. urlsplit gives the same scheme and netloc as urlparse
+        # but does not split the path into path and params.
+        if "://" in obj or not obj.isprintable():
+            result = urllib.parse.urlsplit(obj)
+            if result.scheme and result.netloc:
+                return ""
         return _wrong_type_message(obj, name, "url")
 
 
@@ -1774,6 +2232,7 @@ class date_time(compiled_schema):
 
     format: str | None
     __name__: str
+    pattern: tuple[re.Pattern[str], tuple[str, ...]] | None
 
     def __init__(self, format: str | None = None) -> None:
         """
@@ -1782,6 +2241,10 @@ class date_time(compiled_schema):
         self.format = format
         if format is not None:
             self.__name__ = f"date_time({repr(format)})"
+            self.pattern = _strptime_pattern(format)
+            # Subclasses that override __validate__ are left alone.
+            if type(self).__validate__ is date_time.__validate__:
+                setattr(self, "__validate__", self.__validate_format__)
         else:
             self.__name__ = "date_time"
 
@@ -1792,18 +2255,34 @@ class date_time(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.format is not None:
+            return self.__validate_format__(obj, name, strict, subs)
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, self.__name__)
-        if self.format is not None:
-            try:
-                datetime.datetime.strptime(obj, self.format)
-            except Exception as e:
-                return _wrong_type_message(obj, name, self.__name__, str(e))
-        else:
-            try:
-                datetime.datetime.fromisoformat(obj)
-            except Exception as e:
-                return _wrong_type_message(obj, name, self.__name__, str(e))
+        try:
+            datetime.datetime.fromisoformat(obj)
+        except Exception as e:
+            return _wrong_type_message(obj, name, self.__name__, str(e))
+        return ""
+
+    def __validate_format__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        assert self.format is not None
+        if not isinstance(obj, str):
+            return _wrong_type_message(obj, name, self.__name__)
+        # Try to avoid the relatively slow strptime. If that does not work
+        # then let strptime decide (and explain what is wrong).
+        if self.pattern is not None and _strptime_parse(obj, *self.pattern):
+            return ""
+        try:
+            datetime.datetime.strptime(obj, self.format)
+        except Exception as e:
+            return _wrong_type_message(obj, name, self.__name__, str(e))
         return ""
 
 
@@ -1884,7 +2363,6 @@ class domain_name(compiled_schema):
     Checks if the object is a valid domain name.
     """
 
-    re_asci: re.Pattern[str]
     ascii_only: bool
     resolve: bool
     __name__: str
@@ -1894,7 +2372,6 @@ class domain_name(compiled_schema):
         :param ascii_only: if `False` then allow IDNA domain names
         :param resolve: if `True` check if the domain names resolves
         """
-        self.re_ascii = re.compile(r"[\x00-\x7F]*")
         self.ascii_only = ascii_only
         self.resolve = resolve
         arg_string = ""
@@ -1917,15 +2394,19 @@ class domain_name(compiled_schema):
     ) -> str:
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, self.__name__)
+        # The idna encoding of a domain name is at least as long as the name
+        # itself and it may be at most 253 characters, not counting a
+        # trailing dot. This check avoids doing expensive work on long inputs.
+        if len(obj) > 254:
+            return _wrong_type_message(obj, name, self.__name__, "Domain too long")
         if self.ascii_only:
-            if not self.re_ascii.fullmatch(obj):
+            if not obj.isascii():
                 return _wrong_type_message(
                     obj, name, self.__name__, "Non-ascii characters"
                 )
-        try:
-            idna.encode(obj, uts46=False)
-        except idna.core.IDNAError as e:
-            return _wrong_type_message(obj, name, self.__name__, str(e))
+        explanation = _idna_check(obj)
+        if explanation != "":
+            return _wrong_type_message(obj, name, self.__name__, explanation)
 
         if self.resolve:
             try:
@@ -1935,6 +2416,47 @@ class domain_name(compiled_schema):
         return ""
 
 
+# Built-in schemas that may be used as a bare class. Their instances are
+# immutable, so they are constructed only once (on first use).
+_internable_schemas: frozenset[type] = frozenset(
+    (
+        anything,
+        date,
+        date_time,
+        domain_name,
+        email,
+        float_,
+        ip_address,
+        nothing,
+        time,
+        url,
+    )
+)
+_interned_schemas: dict[type, compiled_schema] = {}
+
+
+def _key_set(args: tuple[object, ...]) -> frozenset[object] | None:
+    # The keys as a frozenset, if they are hashable and distinct, so that
+    # they can be matched against the keys of an object with set operations.
+    try:
+        key_set = frozenset(args)
+    except Exception:
+        return None
+    return key_set if len(key_set) == len(args) else None
+
+
+def _count_keys(obj: Mapping[object, object], args: tuple[object, ...]) -> int:
+    # The number of args that are keys of obj. Counting stops at 2 since that
+    # is enough for one_of and at_most_one_of.
+    count = 0
+    for a in args:
+        if a in obj:
+            count += 1
+            if count == 2:
+                break
+    return count
+
+
 class at_least_one_of(compiled_schema):
     """
     This represents a dictionary with a least one key among a collection of
@@ -1942,6 +2464,7 @@ class at_least_one_of(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
     __name__: str
 
     def __init__(self, *args: object) -> None:
@@ -1949,6 +2472,7 @@ class at_least_one_of(compiled_schema):
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
         args_s = [repr(a) for a in args]
         self.__name__ = f"{self.__class__.__name__}({','.join(args_s)})"
 
@@ -1962,7 +2486,11 @@ class at_least_one_of(compiled_schema):
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, self.__name__)
         try:
-            if any([a in obj for a in self.args]):
+            if self.key_set is not None:
+                found = not obj.keys().isdisjoint(self.key_set)
+            else:
+                found = any(a in obj for a in self.args)
+            if found:
                 return ""
             else:
                 return _wrong_type_message(obj, name, self.__name__)
@@ -1977,6 +2505,7 @@ class at_most_one_of(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
     __name__: str
 
     def __init__(self, *args: object) -> None:
@@ -1984,6 +2513,7 @@ class at_most_one_of(compiled_schema):
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
         args_s = [repr(a) for a in args]
         self.__name__ = f"{self.__class__.__name__}({','.join(args_s)})"
 
@@ -1997,7 +2527,11 @@ class at_most_one_of(compiled_schema):
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, self.__name__)
         try:
-            if sum([a in obj for a in self.args]) <= 1:
+            if self.key_set is not None:
+                count = len(obj.keys() & self.key_set)
+            else:
+                count = _count_keys(obj, self.args)
+            if count <= 1:
                 return ""
             else:
                 return _wrong_type_message(obj, name, self.__name__)
@@ -2012,6 +2546,7 @@ class one_of(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
     __name__: str
 
     def __init__(self, *args: object) -> None:
@@ -2019,6 +2554,7 @@ class one_of(compiled_schema):
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
         args_s = [repr(a) for a in args]
         self.__name__ = f"{self.__class__.__name__}({','.join(args_s)})"
 
@@ -2032,7 +2568,11 @@ class one_of(compiled_schema):
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, self.__name__)
         try:
-            if sum([a in obj for a in self.args]) == 1:
+            if self.key_set is not None:
+                count = len(obj.keys() & self.key_set)
+            else:
+                count = _count_keys(obj, self.args)
+            if count == 1:
                 return ""
             else:
                 return _wrong_type_message(obj, name, self.__name__)
@@ -2047,12 +2587,14 @@ class keys(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
 
     def __init__(self, *args: object) -> None:
         """
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
 
     def __validate__(
         self,
@@ -2063,6 +2605,8 @@ class keys(compiled_schema):
     ) -> str:
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, "Mapping")  # TODO: __name__
+        if self.key_set is not None and obj.keys() >= self.key_set:
+            return ""
         for k in self.args:
             if k not in obj:
                 return f"{name}[{repr(k)}] is missing"
@@ -2073,6 +2617,9 @@ class _ifthen(compiled_schema):
     if_schema: compiled_schema
     then_schema: compiled_schema
     else_schema: compiled_schema | None
+    if_validator: Callable[[object, str, bool, Mapping[str, object]], str]
+    then_validator: Callable[[object, str, bool, Mapping[str, object]], str]
+    else_validator: Callable[[object, str, bool, Mapping[str, object]], str] | None
 
     def __init__(
         self,
@@ -2089,6 +2636,11 @@ class _ifthen(compiled_schema):
             )
         else:
             self.else_schema = else_schema
+        self.if_validator = self.if_schema.__validate__
+        self.then_validator = self.then_schema.__validate__
+        self.else_validator = None
+        if self.else_schema is not None:
+            self.else_validator = self.else_schema.__validate__
 
     def __validate__(
         self,
@@ -2097,14 +2649,10 @@ class _ifthen(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        if self.if_schema.__validate__(obj, name=name, strict=strict, subs=subs) == "":
-            return self.then_schema.__validate__(
-                obj, name=name, strict=strict, subs=subs
-            )
-        elif self.else_schema is not None:
-            return self.else_schema.__validate__(
-                obj, name=name, strict=strict, subs=subs
-            )
+        if self.if_validator(obj, name, strict, subs) == "":
+            return self.then_validator(obj, name, strict, subs)
+        elif self.else_validator is not None:
+            return self.else_validator(obj, name, strict, subs)
         return ""
 
 
@@ -2145,6 +2693,13 @@ class ifthen(wrapper):
 
 class _cond(compiled_schema):
     conditions: list[tuple[compiled_schema, compiled_schema]]
+    validators: tuple[
+        tuple[
+            Callable[[object, str, bool, Mapping[str, object]], str],
+            Callable[[object, str, bool, Mapping[str, object]], str],
+        ],
+        ...,
+    ]
 
     def __init__(
         self,
@@ -2159,6 +2714,10 @@ class _cond(compiled_schema):
                     _compile(c[1], _deferred_compiles=_deferred_compiles),
                 )
             )
+        self.validators = tuple(
+            (if_schema.__validate__, then_schema.__validate__)
+            for if_schema, then_schema in self.conditions
+        )
 
     def __validate__(
         self,
@@ -2167,9 +2726,9 @@ class _cond(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        for c in self.conditions:
-            if c[0].__validate__(obj, name=name, strict=strict, subs=subs) == "":
-                return c[1].__validate__(obj, name=name, strict=strict, subs=subs)
+        for if_validator, then_validator in self.validators:
+            if if_validator(obj, name, strict, subs) == "":
+                return then_validator(obj, name, strict, subs)
         return ""
 
 
@@ -2202,6 +2761,10 @@ class cond(wrapper):
 
 class _fields(compiled_schema):
     d: dict[optional_key[str], compiled_schema]
+    entries: tuple[
+        tuple[str, bool, Callable[[object, str, bool, Mapping[str, object]], str]],
+        ...,
+    ]
 
     def __init__(
         self,
@@ -2212,6 +2775,11 @@ class _fields(compiled_schema):
         for k, v in d.items():
             key_ = _canonize_key(k)
             self.d[key_] = _compile(v, _deferred_compiles=_deferred_compiles)
+        # The attribute names, whether they are optional, and the validators
+        # for their values, extracted in advance.
+        self.entries = tuple(
+            (k.key, k.optional, v.__validate__) for k, v in self.d.items()
+        )
 
     def __validate__(
         self,
@@ -2220,22 +2788,14 @@ class _fields(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        for k, v in self.d.items():
-            name_ = f"{name}.{k.key}"
-            if not isinstance(k, optional_key):
-                if not hasattr(obj, k):
-                    return f"{name_} is missing"
-            elif not k.optional:
-                if not hasattr(obj, k.key):
-                    return f"{name_} is missing"
-
-            if isinstance(k, optional_key):
-                k_ = k.key
-            else:
-                k_ = k
-            ret = self.d[k].__validate__(
-                getattr(obj, k_), name=name_, strict=strict, subs=subs
-            )
+        for attr, optional, validate in self.entries:
+            try:
+                value = getattr(obj, attr)
+            except AttributeError:
+                if optional:
+                    continue
+                return f"{name}.{attr} is missing"
+            ret = validate(value, f"{name}.{attr}", strict, subs)
             if ret != "":
                 return ret
         return ""
@@ -2309,7 +2869,6 @@ class _filter(compiled_schema):
                 f"Applying {self.filter_name} to {name} "
                 f"(value: {_c(obj)}) failed: {str(e)}"
             )
-        name = f"{self.filter_name}({name})"
         return self.schema.__validate__(obj, name="object", strict=strict, subs=subs)
 
 
@@ -2401,7 +2960,11 @@ class _type(compiled_schema):
 class _sequence(compiled_schema):
     type_schema: Type[Sequence[object]]
     schema: list[compiled_schema]
+    validators: tuple[Callable[[object, str, bool, Mapping[str, object]], str], ...]
     fill: compiled_schema
+    fill_types: tuple[type, ...]
+    fill_enum: frozenset[object]
+    fill_enum_types: frozenset[type]
 
     def __init__(
         self,
@@ -2423,6 +2986,32 @@ class _sequence(compiled_schema):
                 self.fill = _type(object)
                 self.schema = []
             setattr(self, "__validate__", self.__validate_ellipsis__)
+            if len(self.schema) == 0:
+                setattr(self, "__validate__", self.__validate_fill__)
+                if isinstance(self.fill, _type):
+                    if self.fill.schema == object:
+                        setattr(self, "__validate__", self.__validate_any__)
+                    elif type(self.fill.schema) is type:
+                        # Other metaclasses (e.g. from make_type) may validate
+                        # in __instancecheck__, which should not run twice.
+                        if self.fill.schema == float:
+                            self.fill_types = (int, float)
+                        else:
+                            self.fill_types = (self.fill.schema,)
+                        setattr(self, "__validate__", self.__validate_types__)
+                elif isinstance(self.fill, (_const, _union)):
+                    # Likewise for a constant or a union of constants.
+                    fill_union = self.fill
+                    if isinstance(fill_union, _const):
+                        fill_union = _union((fill_union,))
+                    # Constants that are not equal to themselves are not
+                    # indexed by _union, so they keep the count below short.
+                    consts = fill_union.consts
+                    if sum(len(c) for c in consts.values()) == len(fill_union.schemas):
+                        self.fill_enum = frozenset().union(*consts.values())
+                        self.fill_enum_types = frozenset(consts)
+                        setattr(self, "__validate__", self.__validate_enum__)
+        self.validators = tuple(c.__validate__ for c in self.schema)
 
     def __validate__(
         self,
@@ -2440,9 +3029,8 @@ class _sequence(compiled_schema):
                 return f"{name}[{ls}] is not in the schema"
         if ls > lo:
             return f"{name}[{lo}] is missing"
-        for i in range(ls):
-            name_ = f"{name}[{i}]"
-            ret = self.schema[i].__validate__(obj[i], name_, strict, subs)
+        for i, validate in enumerate(self.validators):
+            ret = validate(obj[i], f"{name}[{i}]", strict, subs)
             if ret != "":
                 return ret
         return ""
@@ -2460,18 +3048,83 @@ class _sequence(compiled_schema):
         lo = len(obj)
         if ls > lo:
             return f"{name}[{lo}] is missing"
-        for i in range(ls):
-            name_ = f"{name}[{i}]"
-            ret = self.schema[i].__validate__(obj[i], name_, strict, subs)
+        for i, validate in enumerate(self.validators):
+            ret = validate(obj[i], f"{name}[{i}]", strict, subs)
             if ret != "":
                 return ret
+        validate = self.fill.__validate__
         for i in range(ls, lo):
-            name_ = f"{name}[{i}]"
-            ret = self.fill.__validate__(obj[i], name_, strict, subs)
+            ret = validate(obj[i], f"{name}[{i}]", strict, subs)
+            if ret != "":
+                return ret
+        return ""
+
+    def __validate_types__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        # Fast path for schemas of the form [T, ...] with T a type. The type
+        # checks for the elements are all done in C. If they do not all pass
+        # then we fall back to the general method for an explanation.
+        if isinstance(obj, self.type_schema):
+            try:
+                if all(map(isinstance, obj, itertools.repeat(self.fill_types))):
+                    return ""
+            except Exception:
+                pass
+        return self.__validate_fill__(obj, name, strict, subs)
+
+    def __validate_enum__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        # Fast path for schemas of the form [C, ...] with C a constant or a
+        # union of constants. The elements are looked up in a frozenset.
+        if isinstance(obj, self.type_schema):
+            try:
+                if self.fill_enum_types.issuperset(map(type, obj)):
+                    if self.fill_enum.issuperset(obj):
+                        return ""
+            except Exception:
+                pass
+        return self.__validate_fill__(obj, name, strict, subs)
+
+    def __validate_fill__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        # Specialization of __validate_ellipsis__ for schemas of the form
+        # [X, ...].
+        if not isinstance(obj, self.type_schema):
+            return _wrong_type_message(obj, name, self.type_schema.__name__)
+        validate = self.fill.__validate__
+        for i, o in enumerate(obj):
+            ret = validate(o, f"{name}[{i}]", strict, subs)
             if ret != "":
                 return ret
         return ""
 
+    def __validate_any__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        # Schemas of the form [...] or [object, ...] only check the type.
+        if not isinstance(obj, self.type_schema):
+            return _wrong_type_message(obj, name, self.type_schema.__name__)
+        return ""
+
     def __str__(self) -> str:
         return str(self.schema)
 
@@ -2533,9 +3186,21 @@ class _callable(compiled_schema):
 
 
 class _dict(compiled_schema):
-    min_keys: set[object]
-    const_keys: set[object]
-    other_keys: set[compiled_schema]
+    min_keys: frozenset[object]
+    const_keys: frozenset[object]
+    other_keys: tuple[compiled_schema, ...]
+    other_validators: tuple[
+        tuple[
+            Callable[[object, str, bool, Mapping[str, object]], str],
+            Callable[[object, str, bool, Mapping[str, object]], str],
+        ],
+        ...,
+    ]
+    key_pattern: re.Pattern[str] | None
+    const_validators: dict[
+        object, Callable[[object, str, bool, Mapping[str, object]], str]
+    ]
+    key_names: dict[object, str]
     schema: dict[object, compiled_schema]
     type_schema: Type[Mapping[object, object]]
 
@@ -2545,9 +3210,10 @@ class _dict(compiled_schema):
         _deferred_compiles: _mapping | None = None,
     ) -> None:
         self.type_schema = type(schema)
-        self.min_keys = set()
-        self.const_keys = set()
-        self.other_keys = set()
+        min_keys = set()
+        const_keys = set()
+        # The non-const keys are tried in the order of the schema.
+        other_keys: dict[compiled_schema, None] = {}
         self.schema = {}
         for k in schema:
             compiled_schema = _compile(schema[k], _deferred_compiles=_deferred_compiles)
@@ -2562,12 +3228,53 @@ class _dict(compiled_schema):
             c = _compile(key, _deferred_compiles=_deferred_compiles)
             if isinstance(c, _const):
                 if not optional:
-                    self.min_keys.add(key)
-                self.const_keys.add(key)
+                    min_keys.add(key)
+                const_keys.add(key)
                 self.schema[key] = compiled_schema
             else:
-                self.other_keys.add(c)
+                other_keys[c] = None
                 self.schema[c] = compiled_schema
+        self.min_keys = frozenset(min_keys)
+        self.const_keys = frozenset(const_keys)
+        self.other_keys = tuple(other_keys)
+        # The validators for the values of the const keys and for the
+        # non-const keys and their values, bound in advance since they are
+        # looked up for every key of the object.
+        self.const_validators = {
+            k: self.schema[k].__validate__ for k in self.const_keys
+        }
+        # The "[repr(k)]" parts of the names of the values of const keys. An
+        # object key has the same repr as the schema key if both are of type
+        # str, which is the case that matters.
+        self.key_names = {k: f"[{repr(k)}]" for k in self.const_keys if type(k) is str}
+        self.other_validators = tuple(
+            (kk.__validate__, self.schema[kk].__validate__) for kk in self.other_keys
+        )
+        # If there are several non-const keys and they are all simple regexes
+        # then we combine them into a single regex. Matching it tells us which
+        # is the first key that matches, or that none of them matches. The
+        # source is taken from the compiled pattern, since a regex may also be
+        # given as an already compiled pattern.
+        self.key_pattern = None
+        if len(self.other_keys) >= 2 and all(
+            type(kk) is regex
+            and kk.fullmatch
+            and isinstance(kk.pattern.pattern, str)
+            and kk.pattern.flags == re.UNICODE
+            and kk.pattern.groups == 0
+            for kk in self.other_keys
+        ):
+            try:
+                self.key_pattern = _re_compile(
+                    "|".join(
+                        f"({cast(regex, kk).pattern.pattern})" for kk in self.other_keys
+                    ),
+                    0,
+                )
+            except Exception:
+                pass
+        if len(self.other_keys) == 0:
+            setattr(self, "__validate__", self.__validate_const_keys__)
 
     def __validate__(
         self,
@@ -2579,28 +3286,41 @@ class _dict(compiled_schema):
         if not isinstance(obj, self.type_schema):
             return _wrong_type_message(obj, name, self.type_schema.__name__)
 
-        for k in self.min_keys:
-            if k not in obj:
-                name_ = f"{name}[{repr(k)}]"
-                return f"{name_} is missing"
+        if not obj.keys() >= self.min_keys:
+            for k in self.min_keys:
+                if k not in obj:
+                    name_ = f"{name}[{repr(k)}]"
+                    return f"{name_} is missing"
 
+        const_validators = self.const_validators
+        key_names = self.key_names
+        key_pattern = self.key_pattern
         for k in obj:
             vals = []
-            name_ = f"{name}[{repr(k)}]"
-            if k in self.const_keys:
-                val = self.schema[k].__validate__(
-                    obj[k], name=name_, strict=strict, subs=subs
-                )
+            key_name = key_names.get(k) if type(k) is str else None
+            if key_name is not None:
+                name_ = name + key_name
+            else:
+                name_ = f"{name}[{repr(k)}]"
+            const_validator = const_validators.get(k)
+            if const_validator is not None:
+                val = const_validator(obj[k], name_, strict, subs)
                 if val == "":
                     continue
                 else:
                     vals.append(val)
 
-            for kk in self.other_keys:
-                if kk.__validate__(k, name="key", strict=strict, subs=subs) == "":
-                    val = self.schema[kk].__validate__(
-                        obj[k], name=name_, strict=strict, subs=subs
-                    )
+            other_validators = self.other_validators
+            if key_pattern is not None:
+                m = key_pattern.fullmatch(k) if isinstance(k, str) else None
+                if m is None:
+                    other_validators = ()
+                elif m.lastindex is not None:
+                    first = m.lastindex - 1
+                    other_validators = other_validators[first:]
+            for key_validator, value_validator in other_validators:
+                if key_validator(k, "key", strict, subs) == "":
+                    val = value_validator(obj[k], name_, strict, subs)
                     if val == "":
                         break
                     else:
@@ -2612,6 +3332,42 @@ class _dict(compiled_schema):
                     return f"{name_} is not in the schema"
         return ""
 
+    def __validate_const_keys__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        # Specialization of __validate__ for schemas whose keys are all const
+        # keys. Then every key of the object has at most one candidate schema.
+        if not isinstance(obj, self.type_schema):
+            return _wrong_type_message(obj, name, self.type_schema.__name__)
+
+        if not obj.keys() >= self.min_keys:
+            for k in self.min_keys:
+                if k not in obj:
+                    name_ = f"{name}[{repr(k)}]"
+                    return f"{name_} is missing"
+
+        const_validators = self.const_validators
+        key_names = self.key_names
+        for k in obj:
+            const_validator = const_validators.get(k)
+            if const_validator is not None:
+                key_name = key_names.get(k) if type(k) is str else None
+                if key_name is not None:
+                    name_ = name + key_name
+                else:
+                    name_ = f"{name}[{repr(k)}]"
+                val = const_validator(obj[k], name_, strict, subs)
+                if val != "":
+                    return val
+            elif strict:
+                name_ = f"{name}[{repr(k)}]"
+                return f"{name_} is not in the schema"
+        return ""
+
     def __str__(self) -> str:
         return str(self.schema)
 
@@ -2620,6 +3376,9 @@ class _set(compiled_schema):
     type_schema: Type[Set[object]]
     schema: compiled_schema
     schema_: Set[object]
+    types: tuple[type, ...]
+    enum: frozenset[object]
+    enum_types: frozenset[type]
 
     def __init__(
         self,
@@ -2636,7 +3395,28 @@ class _set(compiled_schema):
             )
             setattr(self, "__validate__", self.__validate_singleton__)
         else:
-            self.schema = _union(tuple(schema), _deferred_compiles=_deferred_compiles)
+            union_ = _union(tuple(schema), _deferred_compiles=_deferred_compiles)
+            self.schema = union_
+            # Sets of types and sets of constants are checked for the common
+            # case of a valid object by a single scan at C level. Classes with
+            # another metaclass (e.g. from make_type) are skipped, since their
+            # __instancecheck__ may validate and should not run twice.
+            if all(
+                isinstance(s, _type) and type(s.schema) is type for s in union_.schemas
+            ):
+                types_ = [cast(_type, s).schema for s in union_.schemas]
+                if float in types_:
+                    types_.append(int)
+                self.types = tuple(types_)
+                setattr(self, "__validate__", self.__validate_types__)
+            elif sum(len(c) for c in union_.consts.values()) == len(union_.schemas):
+                # This holds only if every alternative is an indexed constant.
+                # So constants that are not equal to themselves (e.g.
+                # Decimal("NaN")), which _union does not index, never take
+                # this path.
+                self.enum = frozenset().union(*union_.consts.values())
+                self.enum_types = frozenset(union_.consts)
+                setattr(self, "__validate__", self.__validate_enum__)
 
     def __validate_empty_set__(
         self,
@@ -2660,9 +3440,9 @@ class _set(compiled_schema):
     ) -> str:
         if not isinstance(obj, set):
             return _wrong_type_message(obj, name, self.type_schema.__name__)
+        validate = self.schema.__validate__
         for i, o in enumerate(obj):
-            name_ = f"{name}{{{i}}}"
-            v = self.schema.__validate__(o, name=name_, strict=True, subs=subs)
+            v = validate(o, f"{name}{{{i}}}", True, subs)
             if v != "":
                 return v
         return ""
@@ -2676,13 +3456,44 @@ class _set(compiled_schema):
     ) -> str:
         if not isinstance(obj, self.type_schema):
             return _wrong_type_message(obj, name, self.type_schema.__name__)
+        validate = self.schema.__validate__
         for i, o in enumerate(obj):
-            name_ = f"{name}{{{i}}}"
-            v = self.schema.__validate__(o, name=name_, strict=True, subs=subs)
+            v = validate(o, f"{name}{{{i}}}", True, subs)
             if v != "":
                 return v
         return ""
 
+    def __validate_types__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        if isinstance(obj, self.type_schema):
+            try:
+                if all(map(isinstance, obj, itertools.repeat(self.types))):
+                    return ""
+            except Exception:
+                pass
+        return _set.__validate__(self, obj, name=name, strict=strict, subs=subs)
+
+    def __validate_enum__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        if isinstance(obj, self.type_schema):
+            try:
+                if self.enum_types.issuperset(map(type, obj)):
+                    if self.enum.issuperset(obj):
+                        return ""
+            except Exception:
+                pass
+        return _set.__validate__(self, obj, name=name, strict=strict, subs=subs)
+
     def __str__(self) -> str:
         return str(self.schema_)
 